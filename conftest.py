@@ -0,0 +1 @@
+# Makes the top-level modules importable from the tests when running plain pytest
@@ -2,6 +2,7 @@ import sys
 import os
 import zipfile
 import cadquery as cq
+import numpy as np
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -15,11 +16,14 @@ from PySide6.QtWidgets import (
     QPushButton,
     QDoubleSpinBox,
     QFileDialog,
+    QCheckBox,
 )
 from PySide6.QtCore import Qt
 import vtk
+from vtk.util import numpy_support
 from vtk.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 from models import Geometries, def_dimensions
+import tessellation
 
 
 class CadQueryViewer(QMainWindow):
@@ -146,6 +150,12 @@ class CadQueryViewer(QMainWindow):
         apply_button.clicked.connect(self.on_apply_changes)
         picker_layout.addWidget(apply_button)
 
+        # Checkbox to render the fast analytic preview while the dimensions change
+        self.preview_checkbox = QCheckBox("Fast Preview")
+        self.preview_checkbox.setChecked(True)
+        self.preview_checkbox.toggled.connect(self.on_preview_toggled)
+        picker_layout.addWidget(self.preview_checkbox)
+
         # ComboBox for selecting file format
         format_label = QLabel("Select File Format:")
         picker_layout.addWidget(format_label)
@@ -219,13 +229,13 @@ class CadQueryViewer(QMainWindow):
     def download_external_chip(self):
         file_format = self.format_combobox.currentText().lower()
         file_path = os.path.join(self.save_directory, f"external_chip.{file_format}")
-        self.geometries.external_piece().export(file_path)
+        tessellation.export(self.geometries.external_piece(), file_path)
         print(f"External chip {file_format.upper()} file saved to {file_path}")
 
     def download_middle_chip(self):
         file_format = self.format_combobox.currentText().lower()
         file_path = os.path.join(self.save_directory, f"middle_chip.{file_format}")
-        self.geometries.central_piece().export(file_path)
+        tessellation.export(self.geometries.central_piece(), file_path)
         print(f"Middle chip {file_format.upper()} file saved to {file_path}")
 
     def download_both_as_zip(self):
@@ -234,8 +244,8 @@ class CadQueryViewer(QMainWindow):
         middle_file_path = os.path.join(self.save_directory, f"middle_chip.{file_format}")
         zip_file_path = os.path.join(self.save_directory, "chips.zip")
 
-        self.geometries.external_piece().export(external_file_path)
-        self.geometries.central_piece().export(middle_file_path)
+        tessellation.export(self.geometries.external_piece(), external_file_path)
+        tessellation.export(self.geometries.central_piece(), middle_file_path)
 
         with zipfile.ZipFile(zip_file_path, 'w') as zipf:
             zipf.write(external_file_path, os.path.basename(external_file_path))
@@ -261,20 +271,53 @@ class CadQueryViewer(QMainWindow):
         self.slider_values['w'].setValue(self.geometries.w)
         self.slider_values['h'].setValue(self.geometries.h)
 
-        # Central piece in the first viewport
+        # The exact model is only built on demand when the preview is enabled
+        if self.preview_checkbox.isChecked():
+            self.render_preview()
+        else:
+            self.render_exact()
+
+    def render_exact(self):
+        """
+        Render the exact CadQuery models in their respective viewports.
+        """
+        # Clear the existing actors from the renderer
+        self.viewport1["vtk_renderer"].RemoveAllViewProps()
+
+        # Render the updated central piece
         central_piece = self.geometries.central_piece()
         self.add_model_to_renderer(self.viewport1["vtk_renderer"], central_piece)
 
-        # External piece in the second viewport
+        # Clear the existing actors from the renderer
+        self.viewport2["vtk_renderer"].RemoveAllViewProps()
+
+        # Render the updated external piece
         external_piece = self.geometries.external_piece()
         self.add_model_to_renderer(self.viewport2["vtk_renderer"], external_piece)
 
+    def render_preview(self):
+        """
+        Render the fast analytic preview meshes in their respective viewports.
+        """
+        self.viewport1["vtk_renderer"].RemoveAllViewProps()
+        poly_data = self.mesh_to_vtk(*self.geometries.central_piece_preview())
+        self.add_poly_data_to_renderer(self.viewport1["vtk_renderer"], poly_data)
+
+        self.viewport2["vtk_renderer"].RemoveAllViewProps()
+        poly_data = self.mesh_to_vtk(*self.geometries.external_piece_preview())
+        self.add_poly_data_to_renderer(self.viewport2["vtk_renderer"], poly_data)
+
     def add_model_to_renderer(self, renderer, model):
         """
         Add a CadQuery model to a VTK renderer.
         """
         poly_data = self.cadquery_to_vtk(model)
+        self.add_poly_data_to_renderer(renderer, poly_data)
 
+    def add_poly_data_to_renderer(self, renderer, poly_data):
+        """
+        Add VTK PolyData to a VTK renderer.
+        """
         # Create a mapper and actor
         mapper = vtk.vtkPolyDataMapper()
         mapper.SetInputData(poly_data)
@@ -294,21 +337,23 @@ class CadQueryViewer(QMainWindow):
         Converts a CadQuery shape into VTK PolyData for rendering.
         """
         solid = shape.val()
-        vertices, triangles = solid.tessellate(1.0)
+        vertices, triangles = tessellation.tessellate(solid, tessellation.VIEW_TOLERANCE)
+        return self.mesh_to_vtk(vertices, triangles)
 
+    def mesh_to_vtk(self, vertices, triangles):
+        """
+        Converts (vertices, triangles) NumPy arrays into VTK PolyData for rendering.
+        """
         points = vtk.vtkPoints()
-        for vertex in vertices:
-            points.InsertNextPoint(vertex.x, vertex.y, vertex.z)
-
-        poly_data = vtk.vtkPolyData()
-        poly_data.SetPoints(points)
+        points.SetData(numpy_support.numpy_to_vtk(vertices, deep=True))
 
+        # Cells are stored as a flat [3, i, j, k, 3, ...] connectivity array
+        cells = np.hstack([np.full((len(triangles), 1), 3), triangles]).astype(np.int64).ravel()
         faces = vtk.vtkCellArray()
-        for triangle in triangles:
-            faces.InsertNextCell(3)
-            for vertex_idx in triangle:
-                faces.InsertCellPoint(vertex_idx)
+        faces.SetCells(len(triangles), numpy_support.numpy_to_vtkIdTypeArray(cells, deep=True))
 
+        poly_data = vtk.vtkPolyData()
+        poly_data.SetPoints(points)
         poly_data.SetPolys(faces)
         return poly_data
 
@@ -326,18 +371,33 @@ class CadQueryViewer(QMainWindow):
     def on_slider_value_changed_cd(self, value):
         self.slider_values['cd'].setValue(value / self.s_scale)
         self.geometries.cd = (value / self.s_scale)
+        self.on_geometry_changed()
     
     def on_slider_value_changed_ct(self, value):
         self.slider_values['ct'].setValue(value / self.s_scale)
         self.geometries.ct = (value / self.s_scale)
+        self.on_geometry_changed()
     
     def on_slider_value_changed_w(self, value):
         self.slider_values['w'].setValue(value / self.s_scale)
         self.geometries.w = (value / self.s_scale)
+        self.on_geometry_changed()
     
     def on_slider_value_changed_h(self, value):
         self.slider_values['h'].setValue(value / self.s_scale)
         self.geometries.h = (value / self.s_scale)
+        self.on_geometry_changed()
+
+    def on_geometry_changed(self):
+        # Sliders fire while the picker section is built, before the viewports exist
+        if hasattr(self, "viewport2") and self.preview_checkbox.isChecked():
+            self.render_preview()
+
+    def on_preview_toggled(self, checked):
+        if checked:
+            self.render_preview()
+        else:
+            self.render_exact()
 
     def on_dropdown_changed(self, index):
         print(f"Dropdown selection changed: {index}")
@@ -386,20 +446,9 @@ class CadQueryViewer(QMainWindow):
         self.geometries.ct = self.slider_values['ct'].value()
         self.geometries.w = self.slider_values['w'].value()
         self.geometries.h = self.slider_values['h'].value()
- 
-        # Clear the existing actors from the renderer
-        self.viewport1["vtk_renderer"].RemoveAllViewProps()
-    
-        # Render the updated central piece
-        central_piece = self.geometries.central_piece()
-        self.add_model_to_renderer(self.viewport1["vtk_renderer"], central_piece)
-
-        # Clear the existing actors from the renderer
-        self.viewport2["vtk_renderer"].RemoveAllViewProps()
 
-        # Render the updated external piece
-        external_piece = self.geometries.external_piece()
-        self.add_model_to_renderer(self.viewport2["vtk_renderer"], external_piece)
+        # Build the exact models on demand
+        self.render_exact()
 
 
 if __name__ == "__main__":
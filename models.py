@@ -1,6 +1,7 @@
 import cadquery as cq
 import numpy as np
 import math
+import preview
 
 def_dimensions = {
         "chip width": 50,               # Width
@@ -200,6 +201,14 @@ class Geometries:
         # Final result
         return result
 
+    def central_piece_preview(self):
+        """Fast approximate (vertices, triangles) mesh of the central piece, built without CadQuery"""
+        return preview.central_piece_preview(self)
+
+    def external_piece_preview(self):
+        """Fast approximate (vertices, triangles) mesh of the external piece, built without CadQuery"""
+        return preview.external_piece_preview(self)
+
     def external_piece(self):
         # Define the base workplane with the initial rectangle and circles
         result = cq.Workplane("XY")
@@ -0,0 +1,381 @@
+import numpy as np
+
+# Angular resolution of the preview meshes (must be a multiple of 8 so the
+# square corners and edge midpoints are sampled exactly)
+PREVIEW_SEGMENTS = 256
+
+# Number of rings between the window and the outer square of a plate face
+PREVIEW_RINGS = 24
+
+# Angular resolution of the pin and hole cylinders
+CYLINDER_SEGMENTS = 48
+
+
+def _angles(segments):
+    """Evenly spaced angles around a full turn"""
+    return np.linspace(0, 2 * np.pi, segments, endpoint=False)
+
+
+def _boundary_radius(half_width, shape, angles):
+    """
+    Distance from the origin to a centered square or circle boundary along each angle.
+    """
+    if shape == "circle":
+        return np.full_like(angles, half_width)
+    if shape == "square":
+        return half_width / np.maximum(np.abs(np.cos(angles)), np.abs(np.sin(angles)))
+    raise ValueError(f"Unknown window shape: {shape}")
+
+
+def _quads_to_triangles(quads, flip=False):
+    """
+    Split (N, 4) quads given counter-clockwise into (2N, 3) triangles.
+    """
+    triangles = np.concatenate([quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]])
+    if flip:
+        triangles = triangles[:, ::-1]
+    return triangles
+
+
+def merge_meshes(meshes):
+    """
+    Concatenate several (vertices, triangles) meshes into a single one.
+    """
+    offsets = np.cumsum([0] + [len(vertices) for vertices, _ in meshes[:-1]])
+    vertices = np.concatenate([vertices for vertices, _ in meshes])
+    triangles = np.concatenate([triangles + offset for (_, triangles), offset in zip(meshes, offsets)])
+    return vertices, triangles
+
+
+def _empty_mesh():
+    """Mesh without any vertex or triangle"""
+    return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+
+
+def _signed_areas(vertices, triangles):
+    """Signed area of each triangle projected on the XY plane (positive when counter-clockwise)"""
+    a, b, c = (vertices[triangles[:, i], :2] for i in range(3))
+    return ((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])) / 2
+
+
+def _polygon_area(points):
+    """Signed area of a closed polygon (positive when counter-clockwise)"""
+    x, y = points[:, 0], points[:, 1]
+    return (np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))) / 2
+
+
+def _plate_radii(width, window, window_shape, angles):
+    """
+    Window and outer boundary radii of a plate, with the window clamped to the plate.
+    """
+    outer = _boundary_radius(width / 2, "square", angles)
+    inner = np.minimum(_boundary_radius(window / 2, window_shape, angles), outer)
+    return inner, outer
+
+
+def _overlaps_disk(vertices, triangles, disk):
+    """
+    Whether each triangle intersects the interior of a (x, y, radius) disk.
+    """
+    center = np.array(disk[:2])
+    corners = vertices[triangles][:, :, :2]
+    distance = np.full(len(triangles), np.inf)
+    sides = []
+    for i in range(3):
+        a, b = corners[:, i], corners[:, (i + 1) % 3]
+        ab = b - a
+        length = np.maximum(np.einsum("ij,ij->i", ab, ab), 1e-30)
+        u = np.clip(np.einsum("ij,ij->i", center - a, ab) / length, 0, 1)
+        distance = np.minimum(distance, np.linalg.norm(a + u[:, None] * ab - center, axis=1))
+        sides.append(ab[:, 0] * (center[1] - a[:, 1]) - ab[:, 1] * (center[0] - a[:, 0]))
+    sides = np.array(sides)
+    contains = np.all(sides >= 0, axis=0) | np.all(sides <= 0, axis=0)
+    return contains | (distance < disk[2])
+
+
+def _hole_block(hole, width, window, window_shape, segments, rings):
+    """
+    Block of polar grid cells enclosing a hole, with one spare cell on every side.
+
+    Returns the (first ring, last ring, first segment, last segment) bounds of the
+    block, the segments being unwrapped around the hole, or None if the hole does
+    not lie fully inside the plate face.
+    """
+    hx, hy, hr = hole
+    rim = _angles(CYLINDER_SEGMENTS)
+    x = hx + hr * np.cos(rim)
+    y = hy + hr * np.sin(rim)
+    theta = np.arctan2(y, x)
+    rho = np.hypot(x, y)
+
+    inner, outer = _plate_radii(width, window, window_shape, theta)
+    if np.any(rho <= inner) or np.any(rho >= outer):
+        return None
+    t = (rho - inner) / (outer - inner)
+
+    step = 2 * np.pi / segments
+    center = np.arctan2(hy, hx)
+    theta = center + (theta - center + np.pi) % (2 * np.pi) - np.pi
+    first_segment = int(np.floor(theta.min() / step)) - 1
+    last_segment = int(np.ceil(theta.max() / step)) + 1
+    if last_segment - first_segment >= segments:
+        return None
+    first_ring = max(int(np.floor(t.min() * rings)) - 1, 0)
+    last_ring = min(int(np.ceil(t.max() * rings)) + 1, rings)
+    return first_ring, last_ring, first_segment, last_segment
+
+
+def _zip_loops(outer, inner, center):
+    """
+    Triangulate the band between two closed loops surrounding a center.
+
+    Both loops are walked counter-clockwise by their angle around the center,
+    always advancing the loop whose next vertex comes first. Triangles index the
+    outer loop first, then the inner loop.
+    """
+    def unwrapped(points, start):
+        return (np.arctan2(points[:, 1] - center[1], points[:, 0] - center[0]) - start) % (2 * np.pi)
+
+    start = np.arctan2(inner[0, 1] - center[1], inner[0, 0] - center[0])
+    inner_angles = unwrapped(inner, start)
+    outer_angles = unwrapped(outer, start)
+    shift = int(np.argmin(outer_angles))
+    order = np.roll(np.arange(len(outer)), -shift)
+    outer_angles = outer_angles[order]
+
+    n_outer, n_inner = len(outer), len(inner)
+    inner_angles = np.append(inner_angles, 2 * np.pi)
+    outer_angles = np.append(outer_angles, outer_angles[0] + 2 * np.pi)
+    triangles = []
+    i = j = 0
+    while i < n_outer or j < n_inner:
+        a = order[i % n_outer]
+        b = n_outer + j % n_inner
+        if i == n_outer or (j < n_inner and inner_angles[j + 1] <= outer_angles[i + 1]):
+            triangles.append((a, b, n_outer + (j + 1) % n_inner))
+            j += 1
+        else:
+            triangles.append((a, b, order[(i + 1) % n_outer]))
+            i += 1
+    return np.array(triangles, dtype=np.int64)
+
+
+def plate_face_mesh(width, window, window_shape, z, holes=(), up=True,
+                    segments=PREVIEW_SEGMENTS, rings=PREVIEW_RINGS):
+    """
+    Flat face of a square plate with a centered window, pierced by circular holes.
+
+    The face is meshed as a polar grid running from the window to the outer square.
+    Around each hole a block of grid cells is removed and the band between the block
+    outline and the hole rim is stitched back, the rim matching the vertices of
+    ``cylinder_mesh``. Holes that do not lie fully inside the face (e.g. crossing the
+    window) only remove the grid triangles they touch, and the window is clamped to
+    the plate.
+
+    :param width: Outer width of the square plate
+    :param window: Width (square) or diameter (circle) of the centered window
+    :param window_shape: Either "square" or "circle"
+    :param z: Height of the face
+    :param holes: Sequence of (x, y, radius) holes
+    :param up: Whether the face points towards +Z
+    """
+    angles = _angles(segments)
+    inner, outer = _plate_radii(width, window, window_shape, angles)
+    if np.all(inner >= outer):
+        return _empty_mesh()
+
+    t = np.linspace(0, 1, rings + 1)[:, None]
+    radii = inner + t * (outer - inner)
+    # Keep the last ring exactly on the outer square, shared with plate_walls_mesh
+    radii[-1] = outer
+    x = radii * np.cos(angles)
+    y = radii * np.sin(angles)
+    vertices = [np.column_stack([x.ravel(), y.ravel()])]
+    n_vertices = x.size
+
+    ring = np.arange(rings)[:, None]
+    segment = np.arange(segments)[None, :]
+    next_segment = (segment + 1) % segments
+    quads = np.stack([
+        ring * segments + segment,
+        (ring + 1) * segments + segment,
+        (ring + 1) * segments + next_segment,
+        ring * segments + next_segment,
+    ], axis=-1).reshape(-1, 4)
+
+    keep = np.ones(len(quads), dtype=bool)
+    partial = []
+    patches = []
+    for hole in holes:
+        block = _hole_block(hole, width, window, window_shape, segments, rings)
+        if block is None:
+            partial.append(hole)
+            continue
+        first_ring, last_ring, first_segment, last_segment = block
+        block_rings = np.arange(first_ring, last_ring)
+        block_segments = np.arange(first_segment, last_segment) % segments
+        keep[(block_rings[:, None] * segments + block_segments[None, :]).ravel()] = False
+
+        # Outline of the block, walked along its four sides
+        outline = [(first_ring, s) for s in range(first_segment, last_segment + 1)]
+        outline += [(r, last_segment) for r in range(first_ring + 1, last_ring + 1)]
+        outline += [(last_ring, s) for s in range(last_segment - 1, first_segment - 1, -1)]
+        outline += [(first_ring + r, first_segment) for r in range(last_ring - first_ring - 1, 0, -1)]
+        outline = np.array([r * segments + s % segments for r, s in outline])
+        outline_points = vertices[0][outline]
+        if _polygon_area(outline_points) < 0:
+            outline, outline_points = outline[::-1], outline_points[::-1]
+
+        hx, hy, hr = hole
+        rim = _angles(CYLINDER_SEGMENTS)
+        rim_points = np.column_stack([hx + hr * np.cos(rim), hy + hr * np.sin(rim)])
+        band = _zip_loops(outline_points, rim_points, (hx, hy))
+        # Map the band indices onto the grid outline and the rim vertices appended below
+        indices = np.concatenate([outline, n_vertices + np.arange(len(rim_points))])
+        patches.append(indices[band])
+        vertices.append(rim_points)
+        n_vertices += len(rim_points)
+
+    vertices = np.vstack(vertices)
+    vertices = np.column_stack([vertices, np.full(len(vertices), z)])
+
+    # Going outwards then around is counter-clockwise seen from +Z
+    triangles = _quads_to_triangles(quads[keep])
+    for hole in partial:
+        triangles = triangles[~_overlaps_disk(vertices, triangles, hole)]
+    if patches:
+        band = np.vstack(patches)
+        clockwise = _signed_areas(vertices, band) < 0
+        band[clockwise] = band[clockwise][:, ::-1]
+        triangles = np.vstack([triangles, band])
+    if not up:
+        triangles = triangles[:, ::-1]
+    return vertices, triangles
+
+
+def plate_walls_mesh(width, window, window_shape, z0, z1, segments=PREVIEW_SEGMENTS):
+    """
+    Vertical walls of the outer square and of the centered window of a plate.
+
+    Where the window is clamped to the plate neither wall is built.
+    """
+    angles = _angles(segments)
+    inner, outer = _plate_radii(width, window, window_shape, angles)
+    segment = np.arange(segments)
+    next_segment = (segment + 1) % segments
+    solid = (inner < outer)[segment] | (inner < outer)[next_segment]
+    if not solid.any():
+        return _empty_mesh()
+
+    meshes = []
+    for radii, outwards in ((outer, True), (inner, False)):
+        x = np.tile(radii * np.cos(angles), 2)
+        y = np.tile(radii * np.sin(angles), 2)
+        z = np.repeat([z0, z1], segments)
+        vertices = np.column_stack([x, y, z])
+
+        quads = np.column_stack([segment, next_segment, next_segment + segments, segment + segments])[solid]
+        meshes.append((vertices, _quads_to_triangles(quads, flip=not outwards)))
+    return merge_meshes(meshes)
+
+
+def disk_mesh(center, radius, z, up=True, segments=CYLINDER_SEGMENTS):
+    """
+    Flat disk at height z, meshed as a triangle fan.
+    """
+    angles = _angles(segments)
+    vertices = np.column_stack([
+        np.append(center[0] + radius * np.cos(angles), center[0]),
+        np.append(center[1] + radius * np.sin(angles), center[1]),
+        np.full(segments + 1, z),
+    ])
+    segment = np.arange(segments)
+    triangles = np.column_stack([np.full(segments, segments), segment, (segment + 1) % segments])
+    if not up:
+        triangles = triangles[:, ::-1]
+    return vertices, triangles
+
+
+def annulus_mesh(center, inner_radius, outer_radius, z, up=True, segments=CYLINDER_SEGMENTS):
+    """
+    Flat ring at height z, sharing its rims with ``cylinder_mesh`` of the same radii.
+    """
+    angles = _angles(segments)
+    radii = np.repeat([inner_radius, outer_radius], segments)
+    vertices = np.column_stack([
+        center[0] + radii * np.cos(np.tile(angles, 2)),
+        center[1] + radii * np.sin(np.tile(angles, 2)),
+        np.full(2 * segments, z),
+    ])
+    segment = np.arange(segments)
+    next_segment = (segment + 1) % segments
+    quads = np.column_stack([segment, segment + segments, next_segment + segments, next_segment])
+    return vertices, _quads_to_triangles(quads, flip=not up)
+
+
+def cylinder_mesh(center, radius, z0, z1, inward=False, caps=True, segments=CYLINDER_SEGMENTS):
+    """
+    Vertical cylinder between z0 and z1.
+
+    Pins are closed cylinders facing outwards; holes are open cylinders facing inwards.
+    """
+    angles = _angles(segments)
+    x = np.tile(center[0] + radius * np.cos(angles), 2)
+    y = np.tile(center[1] + radius * np.sin(angles), 2)
+    z = np.repeat([z0, z1], segments)
+    vertices = np.column_stack([x, y, z])
+
+    segment = np.arange(segments)
+    next_segment = (segment + 1) % segments
+    quads = np.column_stack([segment, next_segment, next_segment + segments, segment + segments])
+    meshes = [(vertices, _quads_to_triangles(quads, flip=inward))]
+    if caps:
+        meshes.append(disk_mesh(center, radius, z0, up=inward, segments=segments))
+        meshes.append(disk_mesh(center, radius, z1, up=not inward, segments=segments))
+    return merge_meshes(meshes)
+
+
+def central_piece_preview(geometries):
+    """
+    Approximate mesh of the central piece built straight from the dimensions.
+
+    The chamfers and fillets of the exact model are left out.
+    """
+    g = geometries
+    pins = g._first_diagonal + g._second_diagonal
+    holes = [(x, y, g._phd) for x, y in pins]
+
+    meshes = [
+        plate_face_mesh(g.w, g.cd, "circle", 0, holes, up=False),
+        plate_face_mesh(g.w, g.cd, "circle", g._mch, holes, up=True),
+        plate_walls_mesh(g.w, g.cd, "circle", 0, g._mch),
+    ]
+    meshes += [cylinder_mesh(pin, g._phd, 0, g._mch, inward=True, caps=False) for pin in pins]
+    return merge_meshes(meshes)
+
+
+def external_piece_preview(geometries):
+    """
+    Approximate mesh of the external piece built straight from the dimensions.
+
+    The pin barbs, the pin slots and the fillets of the exact model are left out.
+    The pins rise from the top face so that the mesh stays closed.
+    """
+    g = geometries
+    pin_holes = [(x, y, g._pbd) for x, y in g._first_diagonal]
+    head_holes = [(x, y, g._phhd) for x, y in g._second_diagonal]
+
+    meshes = [
+        plate_face_mesh(g.w, g.iw, "square", 0, up=False),
+        plate_face_mesh(g.w, g.iw, "square", g._ech, pin_holes + head_holes, up=True),
+        plate_walls_mesh(g.w, g.iw, "square", 0, g._ech),
+    ]
+    for pin in g._first_diagonal:
+        meshes.append(cylinder_mesh(pin, g._pbd, g._ech, g._pbh, caps=False))
+        meshes.append(annulus_mesh(pin, g._pd, g._pbd, g._pbh, up=True))
+        meshes.append(cylinder_mesh(pin, g._pd, g._pbh, g._ph, caps=False))
+        meshes.append(disk_mesh(pin, g._pd, g._ph, up=True))
+    for pin in g._second_diagonal:
+        meshes.append(cylinder_mesh(pin, g._phhd, g._phhh, g._ech, inward=True, caps=False))
+        meshes.append(disk_mesh(pin, g._phhd, g._phhh, up=True))
+    return merge_meshes(meshes)
@@ -0,0 +1,215 @@
+import hashlib
+import io
+import os
+import struct
+import tempfile
+import time
+import numpy as np
+
+# Directory where the tessellations are stored, shared by every process using this module
+CACHE_DIRECTORY = os.environ.get(
+    "COINCHIP_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "coinchip", "tessellation"),
+)
+
+# Size above which the least recently used tessellations are removed
+MAX_CACHE_BYTES = 512 * 2**20
+
+# Age after which a temporary file is considered left over by a crashed writer
+STALE_TEMPORARY_SECONDS = 3600
+
+# Tolerances used for the viewer and for the STL exports
+VIEW_TOLERANCE = 1.0
+STL_TOLERANCE = 0.1
+ANGULAR_TOLERANCE = 0.1
+
+# Cache file layout: magic, vertex count, triangle count, float64 vertices, int64 triangles
+_MAGIC = b"CCTESS01"
+_HEADER = struct.Struct("<8sQQ")
+
+
+def fingerprint(solid):
+    """
+    Content hash of a CadQuery shape, stable across processes.
+
+    The shape is copied without its triangulation first, since tessellating a shape
+    stores the mesh in it and would otherwise change its BREP serialization.
+    """
+    brep = io.BytesIO()
+    solid.copy(mesh=False).exportBrep(brep)
+    return hashlib.sha256(brep.getvalue()).hexdigest()
+
+
+def _cache_path(solid, tolerance, angular_tolerance, cache_directory):
+    key = f"{fingerprint(solid)}-{tolerance!r}-{angular_tolerance!r}"
+    return os.path.join(cache_directory, hashlib.sha256(key.encode()).hexdigest() + ".bin")
+
+
+def _read(path):
+    """
+    Map a cache file into (vertices, triangles) arrays, or return None if it is missing or incomplete.
+    """
+    # The entry can be removed by another process's prune at any point
+    try:
+        with open(path, "rb") as file:
+            magic, n_vertices, n_triangles = _HEADER.unpack(file.read(_HEADER.size))
+
+        vertices_size = n_vertices * 3 * 8
+        triangles_size = n_triangles * 3 * 8
+        if magic != _MAGIC or os.path.getsize(path) != _HEADER.size + vertices_size + triangles_size:
+            return None
+
+        vertices = _map(path, "<f8", _HEADER.size, n_vertices)
+        triangles = _map(path, "<i8", _HEADER.size + vertices_size, n_triangles)
+    except (OSError, ValueError, struct.error):
+        return None
+    return vertices, triangles
+
+
+def _map(path, dtype, offset, rows):
+    """Read-only (rows, 3) array mapped from a cache file"""
+    if rows == 0:
+        # Empty files and zero-length sections can't be mapped
+        return _read_only(np.empty((0, 3), dtype=dtype))
+    return np.asarray(np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(rows, 3)))
+
+
+def _read_only(array):
+    """Flag an array as read-only"""
+    array.setflags(write=False)
+    return array
+
+
+def _remove(path):
+    """Remove a file, ignoring files already removed or still mapped by another process"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def prune(cache_directory=None, max_bytes=MAX_CACHE_BYTES):
+    """
+    Remove stale temporary files and the least recently used tessellations beyond max_bytes.
+    """
+    directory = cache_directory or CACHE_DIRECTORY
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return
+
+    now = time.time()
+    entries = []
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if name.endswith(".tmp") and now - stat.st_mtime > STALE_TEMPORARY_SECONDS:
+            _remove(path)
+        elif name.endswith(".bin"):
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        _remove(path)
+        total -= size
+
+
+def _write(path, vertices, triangles):
+    """
+    Atomically write a cache file.
+
+    The data goes to a temporary file in the cache directory that is then renamed over
+    the final path, so readers only ever see complete files and concurrent writers of
+    the same key simply replace each other's identical content.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, len(vertices), len(triangles)))
+            file.write(np.ascontiguousarray(vertices, dtype="<f8").tobytes())
+            file.write(np.ascontiguousarray(triangles, dtype="<i8").tobytes())
+            file.flush()
+            os.fsync(file.fileno())
+        try:
+            os.replace(temporary_path, path)
+        except PermissionError:
+            # On Windows the file can't be replaced while another process maps it,
+            # in which case that process already wrote the same content
+            if not os.path.exists(path):
+                raise
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+
+def tessellate(solid, tolerance=VIEW_TOLERANCE, angular_tolerance=ANGULAR_TOLERANCE, cache_directory=None):
+    """
+    Tessellate a CadQuery shape into (vertices, triangles) NumPy arrays, reusing the disk cache.
+
+    The returned arrays are always read-only, cached ones being mapped straight from
+    the cache file; copy them before modifying them. Writing a new tessellation prunes
+    the cache. The cache is only an optimisation: if it can't be written, the fresh
+    tessellation is still returned.
+
+    :param solid: CadQuery shape (e.g. ``Workplane.val()``)
+    :param tolerance: Linear tolerance of the tessellation
+    :param angular_tolerance: Angular tolerance of the tessellation
+    :param cache_directory: Cache directory, defaults to CACHE_DIRECTORY
+    """
+    path = _cache_path(solid, tolerance, angular_tolerance, cache_directory or CACHE_DIRECTORY)
+    cached = _read(path)
+    if cached is not None:
+        # Mark the tessellation as recently used for the pruning
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return cached
+
+    vertices, triangles = solid.tessellate(tolerance, angular_tolerance)
+    vertices = np.array([vertex.toTuple() for vertex in vertices], dtype="<f8").reshape(-1, 3)
+    triangles = np.array(triangles, dtype="<i8").reshape(-1, 3)
+    try:
+        _write(path, vertices, triangles)
+        prune(os.path.dirname(path))
+    except OSError:
+        pass
+    return _read_only(vertices), _read_only(triangles)
+
+
+def export_stl(solid, file_path, tolerance=STL_TOLERANCE, angular_tolerance=ANGULAR_TOLERANCE, cache_directory=None):
+    """
+    Write a binary STL file from the cached tessellation of a CadQuery shape.
+    """
+    vertices, triangles = tessellate(solid, tolerance, angular_tolerance, cache_directory)
+    corners = vertices[triangles]
+
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+    records = np.zeros(len(corners), dtype=[("normal", "<f4", 3), ("corners", "<f4", (3, 3)), ("attribute", "<u2")])
+    records["normal"] = normals
+    records["corners"] = corners
+
+    with open(file_path, "wb") as file:
+        file.write(b"CoinChipApp".ljust(80, b"\0"))
+        file.write(struct.pack("<I", len(records)))
+        file.write(records.tobytes())
+
+
+def export(shape, file_path):
+    """
+    Export a CadQuery Workplane, writing STL files from the tessellation cache.
+    """
+    if file_path.lower().endswith(".stl"):
+        export_stl(shape.val(), file_path)
+    else:
+        shape.export(file_path)
@@ -0,0 +1,114 @@
+import math
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+import preview
+
+# Mirrors the pin placement of models.Geometries with the default dimensions
+PIN_DIAGONAL_DISTANCE = 4.6
+WINDOW_WIDTH = 38
+CENTRAL_HOLE_RADIUS = 1.5
+PIN_BASE_RADIUS = 1.6
+PIN_HEAD_HOLE_RADIUS = 1.45
+
+
+def _pins(width):
+    offset = width / 2 - math.sqrt(PIN_DIAGONAL_DISTANCE**2 / 2)
+    return [(offset, offset), (-offset, -offset)], [(offset, -offset), (-offset, offset)]
+
+
+def _geometries(width, coin_diameter=46, coin_thickness=1.5, height=6, screen_thickness=0.15):
+    """Stand-in for models.Geometries exposing the dimensions used by the previews"""
+    first, second = _pins(width)
+    external_height = (height - coin_thickness) / 2 - screen_thickness
+    return SimpleNamespace(
+        w=width, iw=WINDOW_WIDTH, cd=coin_diameter,
+        _first_diagonal=first, _second_diagonal=second,
+        _mch=coin_thickness, _ech=external_height,
+        _phd=CENTRAL_HOLE_RADIUS, _pbd=PIN_BASE_RADIUS, _pd=1.4, _phhd=PIN_HEAD_HOLE_RADIUS,
+        _ph=coin_thickness + external_height + .718, _pbh=external_height + .875, _phhh=external_height - .73,
+    )
+
+
+def _assert_closed(vertices, triangles):
+    """Every edge, after welding coincident vertices, is shared by exactly two consistently oriented triangles"""
+    _, welded = np.unique(np.round(vertices, 6), axis=0, return_inverse=True)
+    triangles = welded.ravel()[triangles]
+    edges = np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]])
+    _, counts = np.unique(np.sort(edges, axis=1), axis=0, return_counts=True)
+    assert np.all(counts == 2)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    assert np.all(counts == 1)
+
+
+def _faces():
+    """Central and external plate faces, with their holes, across the width slider range"""
+    for width in np.arange(30, 70.01, 0.5):
+        first, second = _pins(width)
+        coin_diameter = min(46, width - 1.5)
+        holes = [(x, y, CENTRAL_HOLE_RADIUS) for x, y in first + second]
+        yield width, holes, True, preview.plate_face_mesh(width, coin_diameter, "circle", 0, holes, up=True)
+        holes = [(x, y, PIN_BASE_RADIUS) for x, y in first] + [(x, y, PIN_HEAD_HOLE_RADIUS) for x, y in second]
+        yield width, holes, False, preview.plate_face_mesh(width, WINDOW_WIDTH, "square", 0, holes, up=False)
+
+
+FACES = list(_faces())
+
+
+def _hole_overlap(vertices, triangles, hole):
+    """Triangles reaching inside the hole rim polygon shared with cylinder_mesh"""
+    hx, hy, hr = hole
+    inscribed = hr * math.cos(math.pi / preview.CYLINDER_SEGMENTS) - 1e-9
+    weights = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 1], [1, 1, 0], [1, 0, 1], [0, 1, 1]])
+    weights = weights / weights.sum(axis=1, keepdims=True)
+    points = weights @ vertices[triangles][:, :, :2]
+    return (np.hypot(points[..., 0] - hx, points[..., 1] - hy) < inscribed).any(axis=1)
+
+
+def test_face_triangles_stay_out_of_holes():
+    for width, holes, _, (vertices, triangles) in FACES:
+        for hole in holes:
+            assert not _hole_overlap(vertices, triangles, hole).any(), (width, hole)
+
+
+def test_face_triangles_are_not_flipped():
+    for width, _, up, (vertices, triangles) in FACES:
+        areas = preview._signed_areas(vertices, triangles)
+        assert np.all(areas >= -1e-9 if up else areas <= 1e-9), width
+
+
+def test_face_stays_inside_plate():
+    for width, _, _, (vertices, _) in FACES:
+        assert np.all(np.abs(vertices[:, :2]) <= width / 2 + 1e-9), width
+
+
+def test_face_area_matches_dimensions():
+    width = 60
+    first, second = _pins(width)
+    holes = [(x, y, CENTRAL_HOLE_RADIUS) for x, y in first + second]
+    vertices, triangles = preview.plate_face_mesh(width, 46, "circle", 0, holes)
+    expected = width**2 - math.pi * 23**2 - 4 * math.pi * CENTRAL_HOLE_RADIUS**2
+    assert preview._signed_areas(vertices, triangles).sum() == pytest.approx(expected, rel=1e-3)
+
+
+def test_window_wider_than_plate_is_skipped():
+    vertices, triangles = preview.plate_face_mesh(30, WINDOW_WIDTH, "square", 0)
+    assert len(vertices) == 0 and len(triangles) == 0
+    vertices, triangles = preview.plate_walls_mesh(30, WINDOW_WIDTH, "square", 0, 1)
+    assert len(vertices) == 0 and len(triangles) == 0
+
+
+def test_previews_are_closed():
+    for width in np.arange(30, 70.01, 2.5):
+        _assert_closed(*preview.central_piece_preview(_geometries(width, coin_diameter=min(46, width - 1.5))))
+    # Below about 47.7 the external pins cross the window and the face is notched instead
+    for width in np.arange(50, 70.01, 2.5):
+        _assert_closed(*preview.external_piece_preview(_geometries(width)))
+
+
+def test_geometries_previews():
+    models = pytest.importorskip("models")
+    geometries = models.Geometries()
+    for vertices, triangles in (geometries.central_piece_preview(), geometries.external_piece_preview()):
+        assert triangles.min() >= 0 and triangles.max() < len(vertices)
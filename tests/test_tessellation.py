@@ -0,0 +1,139 @@
+import os
+import struct
+import time
+import numpy as np
+import pytest
+
+import tessellation
+
+
+class _Vertex:
+    def __init__(self, *coordinates):
+        self.coordinates = coordinates
+
+    def toTuple(self):
+        return self.coordinates
+
+
+class _Tetrahedron:
+    """Stand-in for a CadQuery shape, counting its tessellations"""
+
+    def __init__(self):
+        self.tessellations = 0
+
+    def copy(self, mesh=False):
+        return self
+
+    def exportBrep(self, file):
+        file.write(b"tetrahedron")
+
+    def tessellate(self, tolerance, angular_tolerance):
+        self.tessellations += 1
+        vertices = [_Vertex(0, 0, 0), _Vertex(1, 0, 0), _Vertex(0, 1, 0), _Vertex(0, 0, 1)]
+        return vertices, [(0, 2, 1), (0, 1, 3), (0, 3, 2), (1, 2, 3)]
+
+
+def test_write_read_round_trip(tmp_path):
+    path = str(tmp_path / "entry.bin")
+    vertices = np.random.default_rng(0).random((5, 3))
+    triangles = np.array([[0, 1, 2], [2, 3, 4]])
+    tessellation._write(path, vertices, triangles)
+
+    read_vertices, read_triangles = tessellation._read(path)
+    assert np.array_equal(read_vertices, vertices)
+    assert np.array_equal(read_triangles, triangles)
+    assert not read_vertices.flags.writeable and not read_triangles.flags.writeable
+    assert [name for name in os.listdir(tmp_path)] == ["entry.bin"]
+
+
+def test_read_rejects_truncated_and_foreign_files(tmp_path):
+    path = str(tmp_path / "entry.bin")
+    tessellation._write(path, np.zeros((4, 3)), np.zeros((2, 3), dtype=np.int64))
+    with open(path, "rb") as file:
+        data = file.read()
+
+    with open(path, "wb") as file:
+        file.write(data[:-1])
+    assert tessellation._read(path) is None
+
+    with open(path, "wb") as file:
+        file.write(b"NOTCACHE" + data[8:])
+    assert tessellation._read(path) is None
+
+    assert tessellation._read(str(tmp_path / "missing.bin")) is None
+
+
+def test_tessellate_reuses_cache(tmp_path):
+    solid = _Tetrahedron()
+    first = tessellation.tessellate(solid, cache_directory=str(tmp_path))
+    second = tessellation.tessellate(solid, cache_directory=str(tmp_path))
+
+    assert solid.tessellations == 1
+    for computed, cached in zip(first, second):
+        assert np.array_equal(computed, cached)
+        assert type(computed) is type(cached) is np.ndarray
+        assert not computed.flags.writeable and not cached.flags.writeable
+
+
+def test_export_stl_record_size(tmp_path):
+    path = str(tmp_path / "tetrahedron.stl")
+    tessellation.export_stl(_Tetrahedron(), path, cache_directory=str(tmp_path))
+    with open(path, "rb") as file:
+        data = file.read()
+
+    count, = struct.unpack("<I", data[80:84])
+    assert count == 4
+    assert len(data) == 84 + 50 * count
+
+
+def test_prune_removes_stale_temporary_and_oldest_entries(tmp_path):
+    old = time.time() - 2 * tessellation.STALE_TEMPORARY_SECONDS
+    for index, name in enumerate(["a.bin", "b.bin", "c.bin", "stale.tmp", "fresh.tmp"]):
+        path = tmp_path / name
+        path.write_bytes(b"\0" * 100)
+        if name != "fresh.tmp":
+            os.utime(path, (old + index, old + index))
+
+    tessellation.prune(str(tmp_path), max_bytes=250)
+    assert sorted(os.listdir(tmp_path)) == ["b.bin", "c.bin", "fresh.tmp"]
+
+
+def test_fingerprint_ignores_triangulation():
+    cq = pytest.importorskip("cadquery")
+    solid = cq.Workplane("XY").box(10, 10, 2).faces(">Z").hole(3).val()
+    before = tessellation.fingerprint(solid)
+    solid.tessellate(0.1)
+    assert tessellation.fingerprint(solid) == before
+    assert tessellation.fingerprint(cq.Workplane("XY").box(10, 10, 2).faces(">Z").hole(3).val()) == before
+
+
+def test_read_treats_entry_removed_after_header_as_miss(tmp_path, monkeypatch):
+    path = str(tmp_path / "entry.bin")
+    tessellation._write(path, np.zeros((4, 3)), np.zeros((2, 3), dtype=np.int64))
+
+    def removed(_):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(tessellation.os.path, "getsize", removed)
+    assert tessellation._read(path) is None
+
+
+def test_read_round_trips_entry_without_triangles(tmp_path):
+    path = str(tmp_path / "entry.bin")
+    vertices = np.arange(12, dtype=float).reshape(4, 3)
+    tessellation._write(path, vertices, np.empty((0, 3), dtype=np.int64))
+
+    read_vertices, read_triangles = tessellation._read(path)
+    assert np.array_equal(read_vertices, vertices)
+    assert read_triangles.shape == (0, 3)
+
+
+def test_tessellate_without_usable_cache_directory(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    solid = _Tetrahedron()
+    vertices, triangles = tessellation.tessellate(solid, cache_directory=str(blocker / "cache"))
+
+    assert solid.tessellations == 1
+    assert vertices.shape == (4, 3) and triangles.shape == (4, 3)
+    assert not vertices.flags.writeable and not triangles.flags.writeable